@@ -1,29 +1,129 @@
 # Housekeeping
-import glob
 import requests
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import io
 import os
+import shutil
 
-# Variables
-current_date = datetime.date.today()
-current_year = current_date.year
-today = current_date.strftime('%Y%m%d')
-yesterday = current_date - datetime.timedelta(days = 1)
-yesterday = yesterday.strftime('%Y%m%d')
+# Columns clean() filters on, always loaded alongside keep_columns
+filter_columns = ['gameid', 'date', 'datacompleteness', 'league',
+    'position', 'team', 'player']
 
-def download(directory, years=[current_year], delete=True):
+# Arrow-backed strings use vectorised kernels for .str methods when available
+try:
+    import pyarrow
+    string_dtype = 'string[pyarrow]'
+    parquet_errors = (ImportError, ValueError, pyarrow.ArrowException)
+except ImportError:
+    string_dtype = 'string'
+    parquet_errors = (ImportError, ValueError)
+
+# Explicit dtypes to skip inference on the filter columns
+column_dtypes = {'gameid': string_dtype, 'league': 'category',
+    'datacompleteness': 'category'}
+date_format = '%Y/%m/%d %H:%M:%S'
+
+# Results of read() keyed on directory, filters and file modification times
+_read_cache = {}
+read_cache_size = 4
+
+def _read_csv(path, usecols=None, low_memory=True):
+    """
+    Returns a dataframe parsed from an Oracle's Elixir .csv file with typed columns.
+    """
+    return pd.read_csv(path, usecols=usecols, dtype=column_dtypes,
+        parse_dates=['date'], date_format=date_format, low_memory=low_memory)
+
+def _cache_parquet(csv_path):
+    """
+    Writes a typed .parquet copy next to the given .csv file for faster reads.
+    The copy is optional: it is skipped when no parquet engine is installed
+    or the data cannot be converted, and read() falls back to the .csv.
+    """
+    parquet_path = f'{csv_path[:-4]}.parquet'
+    part_path = f'{parquet_path}.part'
+    try:
+        # Parse In One Chunk So Columns Do Not End Up With Mixed Types
+        _read_csv(csv_path, low_memory=False).to_parquet(part_path,
+            compression='snappy')
+        os.replace(part_path, parquet_path)
+    except parquet_errors:
+        pass
+    finally:
+        # Never Leave A Partial Copy That read() Would Prefer Over The .csv
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+def _list_by_year(directory):
+    """
+    Returns a dict of the file names in directory keyed by their four character year prefix.
+    The directory is listed once so callers do not re-scan it for every year.
+    """
+    try:
+        all_files = os.listdir(directory or '.')
+    except FileNotFoundError:
+        all_files = []
+    by_prefix = {}
+    for name in all_files:
+        by_prefix.setdefault(name[:4], []).append(name)
+    return by_prefix
+
+def _pick_available_date(url_base, file, dates):
+    """
+    Returns the first date in dates whose .csv file exists at url_base, or None.
+    """
+    for date in dates:
+        r = requests.head(f'{url_base}{file}{date}.csv', allow_redirects=True)
+        if r.status_code == 200:
+            return date
+    return None
+
+def _download_date(url_base, file, date, directory, etag=None):
+    """
+    Streams the .csv file for the given date from url_base into directory,
+    writing its parquet copy and an .etag sidecar. Returns False without
+    touching disk if the server reports etag as unchanged (304).
+    Raises requests.RequestException on a failed or interrupted request.
+    """
+    csv_path = f'{directory}{file}{date}.csv'
+    headers = {'If-None-Match': etag} if etag else {}
+    with requests.get(f'{url_base}{file}{date}.csv', headers=headers,
+            stream=True, allow_redirects=True) as r:
+        if r.status_code == 304:
+            return False
+        r.raise_for_status()
+        r.raw.decode_content = True
+        
+        # Stream To A Temporary File So A Dropped Connection Leaves No Partial .csv
+        part_path = f'{csv_path}.part'
+        try:
+            with open(part_path, 'wb') as f:
+                shutil.copyfileobj(r.raw, f, length=1 << 20)
+            os.replace(part_path, csv_path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        etag = r.headers.get('ETag')
+    _cache_parquet(csv_path)
+    if etag:
+        with open(f'{directory}{file}.etag', 'w') as f:
+            f.write(etag)
+    return True
+
+def download(directory, years=None, delete=True):
     """
     Downloads Oracle's Elixer .csv files to the given directory for the provided years.
+    Years whose data is unchanged since the last download (by ETag) are skipped.
 
     Parameters
     ----------
     directory : str
         A string containing the filepath to the working directory.
         (e.g. 'C:\\Users\\ProjektStation\\Documents\\OraclesElixir\\')
-    year : str or list
+    year : str, list or None
         A string or list of strings containing years (e.g. ["2019", "2020"]) 
+        Defaults to the current year.
     delete : boolean
         A boolean (True/False) value. 
         If True, will delete files in directory upon download of new data.
@@ -35,9 +135,15 @@ def download(directory, years=[current_year], delete=True):
     # Variables
     url = ('https://oracleselixir-downloadable-match-data.'
         's3-us-west-2.amazonaws.com/')
+    current_date = datetime.date.today()
+    today = current_date.strftime('%Y%m%d')
+    yesterday = current_date - datetime.timedelta(days = 1)
+    yesterday = yesterday.strftime('%Y%m%d')
 
     # Conditional Handling For Years
-    if isinstance(years, list) == False:
+    if years is None:
+        years = [str(current_date.year)]
+    elif isinstance(years, list) == False:
         listed_years = [years]
         years = []
         for year in listed_years:
@@ -45,37 +151,50 @@ def download(directory, years=[current_year], delete=True):
                 years.append(str(year))
     
     # Dynamic Data Import
+    by_prefix = _list_by_year(directory)
     for year in years:
         file = f'{year}_LoL_esports_match_data_from_OraclesElixir_'
-        current_files = [x for x in os.listdir() if x.startswith(file)]
+        current_files = [x for x in by_prefix.get(str(year), []) if x.startswith(file)]
+        
+        local_files = [x for x in current_files if x.endswith('.csv')]
+        if f'{file}{today}.csv' in local_files:
+            continue
+        
+        # Probe Today's File, Falling Back To Yesterday's
+        try:
+            chosen = _pick_available_date(url, file, [today, yesterday])
+        except requests.RequestException as e:
+            print(f'Oracle\'s Elixer download for {year} failed: {e}')
+            continue
+        if chosen is None:
+            print(f'Oracle\'s Elixer data for {year} not available')
+            continue
+        if f'{file}{chosen}.csv' in local_files:
+            continue
+        
+        # Send The Last ETag So Unchanged Data Is Not Downloaded Again
+        etag = None
+        if local_files and f'{file}.etag' in current_files:
+            with open(f'{directory}{file}.etag') as f:
+                etag = f.read().strip()
         
-        if delete and f'{file}{today}.csv' not in current_files:
-             # If today's data not in Dir, optionally delete old versions
+        try:
+            if not _download_date(url, file, chosen, directory, etag):
+                print(f'Oracle\'s Elixer data for {year} is up to date')
+                continue
+            print('Oracle\'s Elixer download successful')
+        except requests.RequestException as e:
+            print(f'Oracle\'s Elixer download for {year} failed: {e}')
+            continue
+        
+        if delete:
+            # Optionally Delete Old Versions Once The New Data Is Saved
             for f in current_files:
-                os.remove(f)
-                
-            try:
-                # Try To Grab File For Current Date
-                filepath = f'{url}{file}{today}.csv'
-                
-                r = requests.get(filepath, allow_redirects=True)
-                data = r.content.decode('utf8')
-                data = pd.read_csv(io.StringIO(data))
-                data.to_csv(f'{directory}{file}{today}.csv', index=False)
-                print('Oracle\'s Elixer download successful')
-                
-            except:
-                # Grab Yesterday's Data If Today's Does Not Exist
-                filepath = f'{url}{file}{yesterday}.csv'
-            
-                r = requests.get(filepath, allow_redirects=True)
-                data = r.content.decode('utf8')
-                data = pd.read_csv(io.StringIO(data))
-                data.to_csv(f'{directory}{file}{yesterday}.csv', index=False)
-                print('Oracle\'s Elixer download successful')
+                if f != f'{file}.etag' and not f.startswith(f'{file}{chosen}'):
+                    os.remove(f'{directory}{f}')
 
 # Update to read only the most recent file for a single year
-def read(directory, years=[current_year]):
+def read(directory, years=None, keep_columns=None, keep_leagues=None):
     """
     Returns a dataframe with the Oracles Elixer data in the provided directory for the given years.
 
@@ -84,40 +203,109 @@ def read(directory, years=[current_year]):
     directory : str
         A string containing the filepath to the working directory.
         (e.g. 'C:\\Users\\ProjektStation\\Documents\\OraclesElixir\\')
-    year : str or list
+    year : str, list or None
         A string or list of strings containing years (e.g. ["2019", "2020"]) 
+        Defaults to the current year.
+    keep_columns : list or None
+        A list of strings for columns to load from the .csv files.
+        The columns used by clean() are always loaded as well.
+    keep_leagues : list or None
+        A list of strings of leagues to keep while loading the data.
+        Names provided must be an exact match.
 
     Returns
     -------
     A Pandas dataframe containing the most recent Oracle's Elixir data 
     for the years provided by the year parameter.
+    Repeated calls return a shallow copy of a cached result while the files are unchanged.
     """
-    oe_data = pd.DataFrame()
+    usecols = None
+    if keep_columns:
+        usecols = list(dict.fromkeys(list(keep_columns) + filter_columns))
     
     # Conditional Handling For Years
-    if isinstance(years, list) == False:
+    if years is None:
+        years = [str(datetime.date.today().year)]
+    elif isinstance(years, list) == False:
         listed_years = [years]
         years = []
         for year in listed_years:
             if isinstance(year, int):
                 years.append(str(year))
     
-    # Dynamic Data Import
+    # Resolve The Most Recent File For Each Year
+    by_prefix = _list_by_year(directory)
+    sources = []
     for year in years:
+        file = f'{year}_LoL_esports_match_data_from_OraclesElixir_'
+        current_files = by_prefix.get(str(year), [])
+        matching_files = [x for x in current_files
+            if x.startswith(file) and x.endswith('.csv')]
+        if not matching_files:
+            print(f'OE Data for {year} not found.')
+            continue
+        # Zero-Padded YYYYMMDD Suffixes Sort Lexicographically By Date
+        import_date = max(matching_files)[-12:-4]
+        
+        # Prefer The Typed Parquet Copy Written By download()
+        if f'{file}{import_date}.parquet' in current_files:
+            sources.append((year, f'{directory}{file}{import_date}.parquet'))
+        else:
+            sources.append((year, f'{directory}{file}{import_date}.csv'))
+    
+    # Return A Copy Of A Previous Result If The Files Are Unchanged
+    try:
+        key = (directory, tuple(usecols or ()), tuple(keep_leagues or ()),
+            tuple((path, os.path.getmtime(path)) for _, path in sources))
+    except OSError:
+        key = None
+    if key in _read_cache:
+        # Shallow Copies Are Free And Isolated Under Copy-On-Write
+        return _read_cache[key].copy(deep=False)
+    
+    # Dynamic Data Import
+    def read_year(source):
+        year, path = source
         try:
-            prefix_path = f'{directory}{year}_LoL_esports_match_data_from_OraclesElixir_'
-            glob_path = prefix_path + '*.csv'
-            matching_files = glob.glob(glob_path)
-            most_recent_file_date = 0
-            for match in matching_files:
-                if int(match[-12:-4]) > most_recent_file_date:
-                    most_recent_file_date = int(match[-12:-4])
-            import_date = str(most_recent_file_date)
-            data = pd.read_csv(f'{prefix_path}{import_date}.csv')
-            oe_data = pd.concat([oe_data, data], axis=0)
-        except:
+            data = None
+            if path.endswith('.parquet'):
+                # Filter Leagues With An Arrow is_in Before Converting To Pandas
+                filters = [('league', 'in', list(keep_leagues))] if keep_leagues else None
+                try:
+                    data = pd.read_parquet(path, columns=usecols, filters=filters)
+                except parquet_errors:
+                    # Unreadable Cache, Fall Back To The .csv Next To It
+                    path = f'{path[:-8]}.csv'
+            if data is None:
+                data = _read_csv(path, usecols)
+            if keep_leagues:
+                # Categorical isin Hashes The Categories, Not Every Row
+                data = data[data['league'].isin(keep_leagues)]
+            return data
+        except OSError:
+            # Only Missing Or Unreadable Files, Bad keep_columns Should Raise
             print(f'OE Data for {year} not found.')
+    
+    # Parse Years In Parallel, Parsers Release The GIL
+    max_workers = max(1, min(len(sources), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = [data for data in executor.map(read_year, sources)
+            if data is not None]
 
+    # Concatenate Once To Avoid Re-Copying Prior Years Each Iteration
+    if not frames:
+        return pd.DataFrame()
+    oe_data = pd.concat(frames, axis=0, ignore_index=True)
+    
+    # Categories Differing Between Years Fall Back To Object On Concat
+    oe_data = oe_data.astype(column_dtypes)
+    
+    # Keep Only The Most Recent Results
+    if key is not None and len(frames) == len(sources):
+        _read_cache[key] = oe_data
+        while len(_read_cache) > read_cache_size:
+            _read_cache.pop(next(iter(_read_cache)))
+        return oe_data.copy(deep=False)
     return oe_data
 
 def clean(oe_data, split_on, keep_identities, keep_leagues, keep_columns):
@@ -150,34 +338,33 @@ def clean(oe_data, split_on, keep_identities, keep_leagues, keep_columns):
     Any games with 'unknown team' or 'unknown player' will be dropped. 
     Any games with null game ids will be dropped.
     """
-    oe_data['date'] = pd.to_datetime(oe_data['date'], format='%Y/%m/%d %H:%M:%S')
-    oe_data = oe_data[oe_data['datacompleteness'] == 'complete']
-    if keep_columns:
-        oe_data = oe_data[keep_columns]
+    # Build A Single Numpy Row Mask So Only Surviving Rows Are Copied
+    mask = (oe_data['datacompleteness'] == 'complete').to_numpy(copy=True)
     if keep_leagues:
-        oe_data = oe_data[oe_data.league.isin(keep_leagues)]
-        
-    oe_data['gameid'] = oe_data['gameid'].str.strip()
-    oe_data = oe_data[oe_data['gameid'].notna()]
+        mask &= oe_data['league'].isin(keep_leagues).to_numpy()
+    mask &= oe_data['gameid'].notna().to_numpy()
     
     if split_on == 'team':
-        oe_data = oe_data[oe_data['position'] == 'team']
+        mask &= (oe_data['position'] == 'team').to_numpy()
         if keep_identities:
-            oe_data = oe_data[oe_data.team.isin(keep_identities)]
-        
-        # Drop Games With "Unknown Team" Lookup Failures
-        dropgames = oe_data[oe_data['team'] == 'unknown team']
-        dropgames = dropgames['gameid'].unique()
-        oe_data = oe_data[~oe_data.gameid.isin(dropgames)]
-        
+            mask &= oe_data['team'].isin(keep_identities).to_numpy()
     elif split_on == 'player':
-        oe_data = oe_data[oe_data['position'] != 'team']
+        mask &= (oe_data['position'] != 'team').to_numpy()
         if keep_identities:
-            oe_data = oe_data[oe_data.player.isin(keep_identities)]
-        
-        # Drop Games With "Unknown Player" Lookup Failures
-        dropgames = oe_data[oe_data['player'] == 'unknown player']
-        dropgames = dropgames['gameid'].unique()
-        oe_data = oe_data[~oe_data.gameid.isin(dropgames)]
+            mask &= oe_data['player'].isin(keep_identities).to_numpy()
+    
+    columns = keep_columns if keep_columns else oe_data.columns
+    oe_data = oe_data.loc[mask, columns].copy()
+    
+    # Dates Are Parsed By read(), Only Convert Frames From Elsewhere
+    if 'date' in oe_data and not pd.api.types.is_datetime64_any_dtype(oe_data['date']):
+        oe_data['date'] = pd.to_datetime(oe_data['date'], format=date_format)
+    oe_data['gameid'] = oe_data['gameid'].astype(string_dtype).str.strip()
+    
+    # Drop Games With "Unknown Team" / "Unknown Player" Lookup Failures
+    if split_on in ('team', 'player'):
+        unknown = oe_data[split_on] == f'unknown {split_on}'
+        dropgames = oe_data.loc[unknown, 'gameid'].unique()
+        oe_data = oe_data[~oe_data['gameid'].isin(dropgames)]
         
     return oe_data